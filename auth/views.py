@@ -8,22 +8,22 @@ from django.urls import reverse_lazy
 class CustomLoginView(LoginView):
     template_name = 'core/login.html'  # keep using core's template (or move to auth/templates later)
 
+    # Checked in order; the first role the user has wins. Readers and any
+    # other roles go to the home page.
+    _ROLE_REDIRECTS = (
+        ('is_editor', 'core:editor_dashboard'),
+        ('is_journalist', 'core:feed'),  # or 'core:journalist_dashboard'
+    )
+
     def form_valid(self, form):
         # Log the user in (this is done by parent class)
-        response = super().form_valid(form)
+        super().form_valid(form)
 
         user = form.get_user()
 
-        # Role-based redirect after successful login
-        if hasattr(user, 'is_editor') and user.is_editor:
-            return HttpResponseRedirect(reverse_lazy('core:editor_dashboard'))
-
-        elif hasattr(user, 'is_journalist') and user.is_journalist:
-            # You can change this to a journalist-specific dashboard later
-            return HttpResponseRedirect(reverse_lazy('core:feed'))  # or 'core:journalist_dashboard'
-
-        else:
-            # Readers + any other roles
-            return HttpResponseRedirect(reverse_lazy('core:home'))
-
-        return response
\ No newline at end of file
+        # Role-based redirect after successful login; each role property is
+        # evaluated at most once
+        for role_attr, url_name in self._ROLE_REDIRECTS:
+            if getattr(user, role_attr, False):
+                return HttpResponseRedirect(reverse_lazy(url_name))
+        return HttpResponseRedirect(reverse_lazy('core:home'))
@@ -1,16 +1,36 @@
+import json
+
 from rest_framework import generics, permissions
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
 from .authentication import ApiKeyAuthentication
-from .models import Article, Publisher, CustomUser
+from .caching import FEED_CACHE_TIMEOUT, CachedResponseMixin, article_etag, feed_cache_key
+from .models import Article, CustomUser
+from .pagination import PublishedArticleCursorPagination
 from .serializers import (
     ArticleListSerializer,
+    ArticleListValuesSerializer,
     ArticleDetailSerializer,
     ArticlePublicSerializer
 )
 from .permissions import IsApiClientForSubscribedContent
+from .querysets import (
+    ARTICLE_LIST_FIELDS,
+    published_article_values,
+    published_articles,
+    published_by_journalist,
+    published_by_publisher,
+    subscribed_articles_filter,
+    subscribed_articles_union,
+)
 
 
 class MyPersonalizedFeedView(generics.ListAPIView):
@@ -24,56 +44,38 @@ class MyPersonalizedFeedView(generics.ListAPIView):
     Features:
     - Requires user authentication
     - Ordered by most recently published first
-    - Uses efficient select_related + distinct
+    - One indexed query per subscription side, combined with UNION
     """
     serializer_class = ArticleListSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        user = self.request.user
-
-        # Get IDs of followed publishers and journalists
-        followed_publisher_ids = user.subscribed_publishers.values_list('id', flat=True)
-        followed_journalist_ids = user.subscribed_journalists.values_list('id', flat=True)
+        # Articles from subscribed publishers UNION articles from followed
+        # independent journalists (publisher is NULL); the sides are disjoint
+        queryset = subscribed_articles_union(self.request.user, ARTICLE_LIST_FIELDS)
+        if queryset is None:
+            return Article.objects.none()  # new accounts: skip the article query entirely
+        return queryset
 
-        # Articles from subscribed publishers
-        qs_publisher = Article.objects.filter(
-            publisher__id__in=followed_publisher_ids,
-            status='published'
-        )
-
-        # Articles from followed independent journalists (publisher is NULL)
-        qs_independent_journalists = Article.objects.filter(
-            author__id__in=followed_journalist_ids,
-            publisher__isnull=True,          # ← very important!
-            status='published'
-        )
 
-        # Union + most recent first
-        return (qs_publisher | qs_independent_journalists)\
-            .select_related('author', 'publisher')\
-            .distinct()\
-            .order_by('-published_at')
-
-
-class ArticleListView(generics.ListAPIView):
+class ArticleListView(CachedResponseMixin, generics.ListAPIView):
     """
     Public endpoint listing the most recent published articles.
 
     - Accessible without authentication
-    - Returns summary view (via ArticleListSerializer)
+    - Returns summary view (ArticleListSerializer's shape, built from values() dicts)
     - Ordered by publication date (newest first)
     - Suitable for homepage feeds, discovery, etc.
+    - Responses cached for 30s (invalidated when any article changes)
     """
-    serializer_class = ArticleListSerializer
+    serializer_class = ArticleListValuesSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        return Article.objects.filter(status='published')\
-            .select_related('author', 'publisher')\
-            .order_by('-published_at')
+        return published_article_values()
 
 
+@method_decorator(etag(article_etag), name='dispatch')
 class ArticleDetailView(generics.RetrieveAPIView):
     """
     Public endpoint for retrieving full details of a single published article.
@@ -82,14 +84,14 @@ class ArticleDetailView(generics.RetrieveAPIView):
     - Uses ArticleDetailSerializer (includes full content, etc.)
     - Only published articles are accessible
     - Lookup by article ID
+    - Sends an ETag; matching If-None-Match requests get a 304 without serialization
     """
     serializer_class = ArticleDetailSerializer
     permission_classes = [permissions.AllowAny]
     lookup_field = 'id'
 
     def get_queryset(self):
-        return Article.objects.filter(status='published')\
-            .select_related('author', 'publisher', 'approved_by')
+        return Article.objects.published_feed().select_related('approved_by')
 
 
 class PublisherArticlesView(generics.ListAPIView):
@@ -105,11 +107,7 @@ class PublisherArticlesView(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        publisher = get_object_or_404(Publisher, pk=self.kwargs['pk'])
-        return Article.objects.filter(
-            publisher=publisher,
-            status='published'
-        ).select_related('author').order_by('-published_at')
+        return published_by_publisher(self.kwargs['pk'], ARTICLE_LIST_FIELDS)
 
 
 class JournalistArticlesView(generics.ListAPIView):
@@ -128,74 +126,60 @@ class JournalistArticlesView(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        journalist = get_object_or_404(CustomUser, username=self.kwargs['username'])
-        return Article.objects.filter(
-            author=journalist,
-            status='published'
-        ).select_related('publisher').order_by('-published_at')
+        return published_by_journalist(self.kwargs['username'], ARTICLE_LIST_FIELDS)
 
 class SubscribedArticlesFeed(generics.ListAPIView):
     """
     GET /api/v1/feed/subscribed/
 
-    Returns paginated list of published articles from:
+    Returns cursor-paginated list of published articles from:
     - publishers the linked user is subscribed to
     - independent journalists the linked user follows
+
+    Serialized pages are cached per reader; the cache is invalidated when an
+    article changes or the reader's subscriptions change.
     """
     serializer_class = ArticlePublicSerializer
     authentication_classes = [ApiKeyAuthentication]
     permission_classes = [permissions.IsAuthenticated, IsApiClientForSubscribedContent]
-    pagination_class = None  # or use PageNumberPagination / LimitOffsetPagination
+    pagination_class = PublishedArticleCursorPagination
 
     def get_queryset(self):
         user = self.request.user
 
-        pub_ids = user.subscribed_publishers.values_list('id', flat=True)
-        journ_ids = user.subscribed_journalists.values_list('id', flat=True)
+        condition = subscribed_articles_filter(user)
+        if condition is None:
+            return Article.objects.none()
 
-        qs_pub = Article.objects.filter(
-            publisher__id__in=pub_ids,
-            status='published'
-        )
+        return published_articles().filter(condition)
 
-        qs_indep = Article.objects.filter(
-            author__id__in=journ_ids,
-            publisher__isnull=True,
-            status='published'
-        )
-
-        return (qs_pub | qs_indep) \
-            .select_related('author', 'publisher') \
-            .distinct() \
-            .order_by('-published_at')
-
-class PublicPublisherArticles(generics.ListAPIView):
+    def list(self, request, *args, **kwargs):
+        key = feed_cache_key(request.user.pk, request)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, timeout=FEED_CACHE_TIMEOUT)
+        return Response(data)
+
+class PublicPublisherArticles(CachedResponseMixin, generics.ListAPIView):
     """Public list of published articles for one publisher"""
     serializer_class = ArticleListSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        publisher = get_object_or_404(Publisher, pk=self.kwargs['pk'])
-        return Article.objects.filter(
-            publisher=publisher,
-            status='published'
-        ).select_related('author').order_by('-published_at')
+        return published_by_publisher(self.kwargs['pk'], ARTICLE_LIST_FIELDS)
 
 
-class PublicJournalistArticles(generics.ListAPIView):
+class PublicJournalistArticles(CachedResponseMixin, generics.ListAPIView):
     """Public list of published articles by one journalist"""
     serializer_class = ArticleListSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        journalist = get_object_or_404(CustomUser, username=self.kwargs['username'])
-        return Article.objects.filter(
-            author=journalist,
-            status='published'
-        ).select_related('publisher').order_by('-published_at')
+        return published_by_journalist(self.kwargs['username'], ARTICLE_LIST_FIELDS)
 
 
-class PublisherArticlesPublic(generics.ListAPIView):
+class PublisherArticlesPublic(CachedResponseMixin, generics.ListAPIView):
     """
     GET /api/v1/publishers/<pk>/articles/
 
@@ -205,13 +189,9 @@ class PublisherArticlesPublic(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]  # or restrict to ApiClient
 
     def get_queryset(self):
-        publisher = get_object_or_404(Publisher, pk=self.kwargs['pk'])
-        return Article.objects.filter(
-            publisher=publisher,
-            status='published'
-        ).select_related('author').order_by('-published_at')
+        return published_by_publisher(self.kwargs['pk'])
 
-class JournalistArticlesPublic(generics.ListAPIView):
+class JournalistArticlesPublic(CachedResponseMixin, generics.ListAPIView):
     """
     GET /api/v1/journalists/<username>/articles/
     """
@@ -219,44 +199,43 @@ class JournalistArticlesPublic(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        journalist = get_object_or_404(CustomUser, username=self.kwargs['username'])
-        return Article.objects.filter(
-            author=journalist,
-            status='published'
-        ).select_related('publisher').order_by('-published_at')
+        return published_by_journalist(self.kwargs['username'])
 
 
 class PublicJournalistArticlesView(generics.ListAPIView):
     """
     GET /api/v1/journalists/<username>/articles/public/
 
-    Publicly accessible list of all **published** articles written by a specific journalist.
-    Shows both independent articles and articles published through publishers.
+    Publicly accessible, cursor-paginated list of all **published** articles written by a
+    specific journalist. Shows both independent articles and articles published through publishers.
 
     No authentication required.
+
+    The routed view is always paginated. The streamed, unpaginated branch of
+    list() only runs for subclasses that set ``pagination_class = None``.
     """
     serializer_class = ArticlePublicSerializer
     permission_classes = [permissions.AllowAny]
-    pagination_class = None  # or use rest_framework.pagination.PageNumberPagination
+    pagination_class = PublishedArticleCursorPagination
 
     def get_queryset(self):
         username = self.kwargs.get('username')
 
-        journalist = get_object_or_404(
-            CustomUser,
-            username=username,
-            groups__name='Journalist'  # only real journalists
+        # Only real journalists — EXISTS on the group through table, so the
+        # lookup needs no JOIN against auth_group rows
+        is_journalist = CustomUser.groups.through.objects.filter(
+            customuser_id=OuterRef('pk'),
+            group__name='Journalist'
+        )
+        # Kept on the view so list() can reuse it without a second lookup
+        self.journalist = get_object_or_404(
+            CustomUser.objects.filter(Exists(is_journalist)),
+            username=username
         )
 
         # Only published articles
         # Includes both: publisher-affiliated and independent (publisher IS NULL)
-        return Article.objects.filter(
-            author=journalist,
-            status='published'
-        ).select_related(
-            'publisher',
-            'author'
-        ).order_by('-published_at')
+        return published_articles().filter(author=self.journalist)
 
     def get_serializer_context(self):
         """
@@ -269,8 +248,8 @@ class PublicJournalistArticlesView(generics.ListAPIView):
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
 
-        # Optional: add extra context / metadata
-        journalist = get_object_or_404(CustomUser, username=kwargs.get('username'))
+        # Optional: add extra context / metadata (fetched by get_queryset)
+        journalist = self.journalist
 
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -284,13 +263,29 @@ class PublicJournalistArticlesView(generics.ListAPIView):
             }
             return response
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'journalist': {
-                'username': journalist.username,
-                'full_name': journalist.get_full_name() or journalist.username,
-                'bio': journalist.bio or None,
-            },
-            'results': serializer.data,
-            'count': queryset.count(),
-        })
\ No newline at end of file
+        # Unpaginated fallback, reached only by subclasses without pagination:
+        # stream the list so memory stays bounded by the iterator chunk size
+        # rather than the journalist's article count
+        journalist_data = {
+            'username': journalist.username,
+            'full_name': journalist.get_full_name() or journalist.username,
+            'bio': journalist.bio or None,
+        }
+        return StreamingHttpResponse(
+            self._stream_results(queryset, journalist_data),
+            content_type='application/json'
+        )
+
+    def _stream_results(self, queryset, journalist_data):
+        """
+        Yield the same JSON document the paginated branch would build in memory
+        (``{"journalist": ..., "results": [...], "count": n}``), one article at a time.
+        """
+        yield '{"journalist": %s, "results": [' % json.dumps(journalist_data, cls=JSONEncoder)
+        count = 0
+        for article in queryset.iterator(chunk_size=200):
+            if count:
+                yield ', '
+            yield json.dumps(self.get_serializer(article).data, cls=JSONEncoder)
+            count += 1
+        yield '], "count": %d}' % count
\ No newline at end of file
@@ -1,11 +1,28 @@
 # core/authentication.py
+import hashlib
 
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
 from .models import ApiClient
 
+# Seconds a resolved API key stays cached; kept short so revocation is honoured quickly
+API_KEY_CACHE_TIMEOUT = 60
+
+# Minimum seconds between two `last_used_at` writes for the same client
+LAST_USED_WRITE_INTERVAL = 60
+
+
+def api_key_cache_key(api_key):
+    """
+    Return the cache key for an API key.
+
+    The key is hashed so raw API keys are never written to the cache backend.
+    """
+    return f"apikey:{hashlib.sha256(api_key.encode()).hexdigest()}"
+
 
 class ApiKeyAuthentication(BaseAuthentication):
     """
@@ -18,7 +35,9 @@ class ApiKeyAuthentication(BaseAuthentication):
     Behavior:
       - If no key is provided → authentication is skipped (returns None)
       - If key is provided → looks up an active ApiClient with matching key
-      - On success → updates the `last_used_at` timestamp and attaches the linked user
+        (served from the cache for API_KEY_CACHE_TIMEOUT seconds after the first hit)
+      - On success → updates the `last_used_at` timestamp (at most once every
+        LAST_USED_WRITE_INTERVAL seconds per client) and attaches the linked user
       - On failure → raises AuthenticationFailed (401 response)
 
     This authentication is typically used for third-party applications or API clients
@@ -49,16 +68,24 @@ class ApiKeyAuthentication(BaseAuthentication):
         if not api_key:
             return None
 
-        try:
-            client = ApiClient.objects.select_related('user').get(
-                api_key=api_key,
-                is_active=True
-            )
+        cache_key = api_key_cache_key(api_key)
+        client = cache.get(cache_key)
+        if client is None:
+            try:
+                client = ApiClient.objects.select_related('user').get(
+                    api_key=api_key,
+                    is_active=True
+                )
+            except ApiClient.DoesNotExist:
+                raise AuthenticationFailed(
+                    'Invalid or inactive API key',
+                    code='invalid_api_key'
+                )
+            cache.set(cache_key, client, timeout=API_KEY_CACHE_TIMEOUT)
+
+        # cache.add() only succeeds when the marker is absent, so concurrent
+        # requests from the same client issue a single UPDATE per interval
+        if cache.add(f"apikey_touched:{client.pk}", 1, timeout=LAST_USED_WRITE_INTERVAL):
             client.last_used_at = timezone.now()
-            client.save(update_fields=['last_used_at'])
-            return (client.user, client)  # user, auth instance
-        except ApiClient.DoesNotExist:
-            raise AuthenticationFailed(
-                'Invalid or inactive API key',
-                code='invalid_api_key'
-            )
\ No newline at end of file
+            ApiClient.objects.filter(pk=client.pk).update(last_used_at=client.last_used_at)
+        return (client.user, client)  # user, auth instance
\ No newline at end of file
@@ -0,0 +1,123 @@
+# core/caching.py
+"""
+Response caching helpers for public, anonymous article endpoints.
+
+Cached pages are stored under a key prefix that embeds a version number.
+Bumping the version (done whenever an Article is saved or deleted) makes
+every previously cached page unreachable, so stale lists expire at once
+instead of waiting for their timeout.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+
+from .models import Article
+
+ARTICLE_CACHE_VERSION_KEY = 'article-cache-version'
+
+# Seconds an article's ETag stays cached (also dropped on any article change)
+ARTICLE_ETAG_TIMEOUT = 60
+
+# Seconds a reader's serialized subscribed feed page stays cached
+FEED_CACHE_TIMEOUT = 60
+
+# Seconds evaluated article lists for HTML pages stay cached
+ARTICLE_DATA_CACHE_TIMEOUT = 60
+
+
+def _new_version():
+    # Seeded from the clock so a version lost to eviction never reuses an old number
+    return int(time.time())
+
+
+def article_cache_prefix():
+    """Return the current key prefix for cached article responses."""
+    version = cache.get_or_set(ARTICLE_CACHE_VERSION_KEY, _new_version, timeout=None)
+    return f"articles:v{version}"
+
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key missing (evicted or never set) — start a fresh version
+        cache.set(key, _new_version(), timeout=None)
+
+
+def invalidate_article_cache():
+    """Invalidate all cached article responses by bumping the version."""
+    _bump_version(ARTICLE_CACHE_VERSION_KEY)
+
+
+def _feed_version_key(user_id):
+    return f"feed-version:{user_id}"
+
+
+def feed_cache_key(user_id, request):
+    """
+    Cache key for one page of a reader's subscribed feed.
+
+    Combines the global article version (any article change), the reader's
+    own subscription version (see invalidate_feed_cache) and the full path,
+    so each cursor page is cached separately.
+    """
+    version = cache.get_or_set(_feed_version_key(user_id), _new_version, timeout=None)
+    path_hash = hashlib.md5(request.get_full_path().encode(), usedforsecurity=False).hexdigest()
+    return f"{article_cache_prefix()}:feed:{user_id}:v{version}:{path_hash}"
+
+
+def invalidate_feed_cache(user_ids):
+    """Invalidate cached subscribed feeds of the given readers."""
+    for user_id in user_ids:
+        _bump_version(_feed_version_key(user_id))
+
+
+def cached_article_data(name, producer, timeout=ARTICLE_DATA_CACHE_TIMEOUT):
+    """
+    Return ``producer()`` cached under the current article version.
+
+    For evaluated article data (lists, counts) shared by all visitors. Unlike
+    whole-response caching this is safe on HTML pages that render per-user
+    content, and any Article save/delete expires it with the version bump.
+    """
+    return cache.get_or_set(f"{article_cache_prefix()}:{name}", producer, timeout=timeout)
+
+
+class CachedResponseMixin:
+    """
+    View mixin that caches the full response of GET requests for
+    ``cache_timeout`` seconds, keyed on URL + query string.
+    """
+    cache_timeout = 30
+
+    def dispatch(self, request, *args, **kwargs):
+        cached_dispatch = cache_page(
+            self.cache_timeout,
+            key_prefix=article_cache_prefix()
+        )(super().dispatch)
+        return cached_dispatch(request, *args, **kwargs)
+
+
+def article_etag(request, *args, **kwargs):
+    """
+    ETag callback for ``django.views.decorators.http.etag`` on article detail views.
+
+    Built from the article's pk and ``updated_at``; the timestamp is cached so a
+    revalidating client gets its 304 without touching the database. Returns
+    None (no ETag) for missing or unpublished articles.
+    """
+    pk = kwargs.get('id', kwargs.get('pk'))
+
+    def lookup():
+        return Article.objects.filter(pk=pk, status='published') \
+            .values_list('updated_at', flat=True).first()
+
+    updated_at = cache.get_or_set(
+        f"{article_cache_prefix()}:etag:{pk}", lookup, timeout=ARTICLE_ETAG_TIMEOUT
+    )
+    if updated_at is None:
+        return None
+    return f"article-{pk}-{updated_at.timestamp()}"
@@ -5,19 +5,32 @@ from django.shortcuts import redirect
 from django.contrib import messages
 
 
+def _request_has_role(request, role_attr):
+    """
+    Return ``request.user.<role_attr>`` (e.g. ``is_journalist``), memoized on
+    the request so the underlying group query runs at most once per request.
+    """
+    cache_attr = f'_{role_attr}_cached'
+    flag = getattr(request, cache_attr, None)
+    if flag is None:
+        flag = bool(getattr(request.user, role_attr, False))
+        setattr(request, cache_attr, flag)
+    return flag
+
+
 def journalist_required(view_func):
     """
     Decorator that restricts access to views to users who are journalists.
 
     This decorator:
     - Requires the user to be logged in
-    - Checks if the user has the 'is_journalist' property set to True
+    - Checks if the user has the 'is_journalist' property set to True (memoized per request)
     - Redirects non-journalists to the home page with an error message
     """
     @wraps(view_func)
     @login_required
     def _wrapped_view(request, *args, **kwargs):
-        if not getattr(request.user, 'is_journalist', False):
+        if not _request_has_role(request, 'is_journalist'):
             messages.error(request, "Only journalists can perform this action.")
             return redirect('core:home')
         return view_func(request, *args, **kwargs)
@@ -30,13 +43,13 @@ def editor_required(view_func):
 
     This decorator:
     - Requires the user to be logged in (combines with @login_required)
-    - Checks if the user has the 'is_editor' property set to True
+    - Checks if the user has the 'is_editor' property set to True (memoized per request)
     - Redirects non-editors to the home page with an error message
     """
     @wraps(view_func)
     @login_required
     def _wrapped_view(request, *args, **kwargs):
-        if not getattr(request.user, 'is_editor', False):
+        if not _request_has_role(request, 'is_editor'):
             messages.error(request, "Only editors can perform this action.")
             return redirect('core:home')
         return view_func(request, *args, **kwargs)
@@ -1,12 +1,27 @@
 # core/forms.py
+from functools import lru_cache
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
+from django.utils.text import slugify
 
 from .models import Article, CustomUser, Newsletter
 
 
+@lru_cache(maxsize=8)
+def _get_role_group(name):
+    """
+    Return the role Group with the given name, creating it if needed.
+
+    Memoized per process: the role groups are static once created and are
+    never deleted at runtime, so only the first signup per role hits the DB.
+    """
+    group, _ = Group.objects.get_or_create(name=name)
+    return group
+
+
 class SignUpForm(UserCreationForm):
     """
     User registration form with mandatory role selection.
@@ -60,7 +75,7 @@ class SignUpForm(UserCreationForm):
          Save the user and assign them to the selected role group.
 
         - Creates the group if it doesn't exist
-        - Removes membership from all other role groups (enforces single role)
+        - Replaces all existing group memberships (enforces single role)
         """
         user = super().save(commit=False)
         if commit:
@@ -68,17 +83,10 @@ class SignUpForm(UserCreationForm):
 
             role = self.cleaned_data['role']
             group_name = role.capitalize()  # 'Reader', 'Journalist', 'Editor'
-            group, _ = Group.objects.get_or_create(name=group_name)
-            user.groups.add(group)
-
-            # Enforce single role: remove all other role groups this user is in
-            other_roles = {'Reader', 'Journalist', 'Editor'} - {group_name}
-            for other_group_name in other_roles:
-                try:
-                    other_group = Group.objects.get(name=other_group_name)
-                    user.groups.remove(other_group)
-                except Group.DoesNotExist:
-                    pass  # group didn't exist → nothing to remove
+            group = _get_role_group(group_name)
+
+            # Enforce single role: set() replaces the whole membership in one go
+            user.groups.set([group])
 
         return user
 
@@ -89,7 +97,7 @@ class ArticleForm(forms.ModelForm):
     Handles:
     - Main article fields (title, slug, content, excerpt, publisher)
     - Rich textarea widgets for content and excerpt
-    - Slug validation (currently minimal — consider adding uniqueness check)
+    - Slug auto-generation from the title when left blank
 
     Notes:
     - Status and author are typically set in the view (not exposed here)
@@ -110,15 +118,37 @@ class ArticleForm(forms.ModelForm):
         """
         Validate the slug field.
 
-        Current implementation is minimal.
-        Consider adding:
-        - Uniqueness check per author/publisher
-        - Auto-generation fallback in view/model if empty
+        A blank slug is accepted here; clean() fills it in from the title
+        once all fields are cleaned, avoiding slugs already taken.
+        """
+        return self.cleaned_data.get('slug')
+
+    def clean(self):
+        """
+        Fill in a blank slug from the title.
+
+        Collisions are resolved here with one query, so the model's unique
+        check passes and Article.save() writes the slug as-is.
         """
-        slug = self.cleaned_data.get('slug')
-        if not slug:
-            # Optional: auto-generate slug in view or model save()
-            pass
+        cleaned_data = super().clean()
+        title = cleaned_data.get('title')
+        if not cleaned_data.get('slug') and title:
+            base_slug = slugify(title)
+            if base_slug:
+                cleaned_data['slug'] = self._free_slug(base_slug)
+        return cleaned_data
+
+    def _free_slug(self, base_slug):
+        existing = set(
+            Article.objects.filter(slug__startswith=base_slug)
+            .exclude(pk=self.instance.pk)
+            .values_list('slug', flat=True)
+        )
+        slug = base_slug
+        counter = 1
+        while slug in existing:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
         return slug
 
 
@@ -25,13 +25,16 @@ class Command(BaseCommand):
         # Get all useful article permissions
         all_article_perms = Permission.objects.filter(content_type=article_ct)
 
-        # Useful individual permissions
-        perms = {
-            'view': Permission.objects.get(codename='view_article', content_type=article_ct),
-            'add': Permission.objects.get(codename='add_article', content_type=article_ct),
-            'change': Permission.objects.get(codename='change_article', content_type=article_ct),
-            'delete': Permission.objects.get(codename='delete_article', content_type=article_ct),
+        # Useful individual permissions (fetched in a single query)
+        actions = ('view', 'add', 'change', 'delete')
+        by_codename = {
+            p.codename: p
+            for p in Permission.objects.filter(
+                content_type=article_ct,
+                codename__in=[f'{action}_article' for action in actions],
+            )
         }
+        perms = {action: by_codename[f'{action}_article'] for action in actions}
 
         # ── Reader ───────────────────────────────────────────────────────
         reader_group, created = Group.objects.get_or_create(name='Reader')
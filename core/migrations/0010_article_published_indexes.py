@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-15 12:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_alter_apiclient_api_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['status', '-published_at'], name='art_status_pubat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['publisher', 'status', '-published_at'], name='art_pub_status_pubat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', 'status', '-published_at'], name='art_auth_status_pubat_idx'),
+        ),
+    ]
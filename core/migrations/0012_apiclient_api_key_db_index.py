@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-15 12:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_article_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='apiclient',
+            name='api_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Long random token used for API authentication', max_length=64, unique=True),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.15 on 2026-10-15 12:25
+
+import core.models
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_apiclient_api_key_db_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='apiclient',
+            name='user',
+            field=models.ForeignKey(help_text='The reader account whose subscriptions this API client can access', limit_choices_to=core.models.reader_choices, on_delete=django.db.models.deletion.CASCADE, related_name='api_clients', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='approved_by',
+            field=models.ForeignKey(blank=True, limit_choices_to=core.models.editor_choices, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='approved_articles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='author',
+            field=models.ForeignKey(limit_choices_to=core.models.journalist_choices, on_delete=django.db.models.deletion.CASCADE, related_name='articles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='customuser',
+            name='subscribed_journalists',
+            field=models.ManyToManyField(blank=True, limit_choices_to=core.models.journalist_choices, related_name='journalist_followers', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='newsletter',
+            name='author',
+            field=models.ForeignKey(limit_choices_to=core.models.journalist_choices, on_delete=django.db.models.deletion.CASCADE, related_name='newsletters', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='publisher',
+            name='editors',
+            field=models.ManyToManyField(blank=True, limit_choices_to=core.models.editor_choices, related_name='editing_publishers', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='publisher',
+            name='journalists',
+            field=models.ManyToManyField(blank=True, limit_choices_to=core.models.journalist_choices, related_name='affiliated_publishers', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='publisher',
+            name='subscribed_readers',
+            field=models.ManyToManyField(blank=True, limit_choices_to=core.models.reader_choices, related_name='subscribed_publishers', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
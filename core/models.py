@@ -1,12 +1,48 @@
 # core/models.py
-from django.db import models
+import secrets
+
+from django.db import IntegrityError, models, transaction
 from django.urls import reverse
 from django.contrib.auth.models import AbstractUser, Group
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.core.exceptions import ValidationError
 from django.utils.text import slugify
 
 
+# Role group pks, resolved once per process (role groups are never deleted)
+_ROLE_GROUP_IDS = {}
+
+
+def _role_choices(name):
+    """
+    ``limit_choices_to`` filter for users in the given role group.
+
+    Filters on the group pk so the choice query joins only the membership
+    table instead of also joining auth_group to compare names. Falls back to
+    the name filter until the group exists (e.g. before create_initial_groups).
+    """
+    group_id = _ROLE_GROUP_IDS.get(name)
+    if group_id is None:
+        group_id = Group.objects.filter(name=name).values_list('pk', flat=True).first()
+        if group_id is None:
+            return {'groups__name': name}
+        _ROLE_GROUP_IDS[name] = group_id
+    return {'groups__pk': group_id}
+
+
+def reader_choices():
+    return _role_choices('Reader')
+
+
+def journalist_choices():
+    return _role_choices('Journalist')
+
+
+def editor_choices():
+    return _role_choices('Editor')
+
+
 class CustomUser(AbstractUser):
     """
     Custom user model that extends Django's AbstractUser.
@@ -32,23 +68,39 @@ class CustomUser(AbstractUser):
         symmetrical=False,
         related_name='journalist_followers',
         blank=True,
-        limit_choices_to={'groups__name': 'Journalist'},
+        limit_choices_to=journalist_choices,
     )
 
+    @cached_property
+    def group_names(self):
+        """
+        Frozen set of the names of the groups this user belongs to, loaded
+        once per instance; role checks test membership in it.
+
+        Served from prefetch_related('groups') when available, so role checks on
+        prefetched users cost no extra queries. Cleared by a groups m2m_changed
+        receiver (see signals.py) when membership changes.
+        """
+        if 'groups' in getattr(self, '_prefetched_objects_cache', {}):
+            return frozenset(group.name for group in self.groups.all())
+        if self.pk is None:
+            return frozenset()
+        return frozenset(self.groups.values_list('name', flat=True))
+
     @property
     def is_reader(self):
         """Check if the user belongs to the 'Reader' group."""
-        return self.groups.filter(name='Reader').exists()
+        return 'Reader' in self.group_names
 
     @property
     def is_journalist(self):
         """Check if the user belongs to the 'Journalist' group."""
-        return self.groups.filter(name='Journalist').exists()
+        return 'Journalist' in self.group_names
 
     @property
     def is_editor(self):
         """Check if the user belongs to the 'Editor' group."""
-        return self.groups.filter(name='Editor').exists()
+        return 'Editor' in self.group_names
 
     @is_reader.setter
     def is_reader(self, value):
@@ -87,19 +139,19 @@ class Publisher(models.Model):
     editors = models.ManyToManyField(
         CustomUser,
         related_name='editing_publishers',
-        limit_choices_to={'groups__name': 'Editor'},
+        limit_choices_to=editor_choices,
         blank=True,
     )
     journalists = models.ManyToManyField(
         CustomUser,
         related_name='affiliated_publishers',
-        limit_choices_to={'groups__name': 'Journalist'},
+        limit_choices_to=journalist_choices,
         blank=True,
     )
     subscribed_readers = models.ManyToManyField(
         CustomUser,
         related_name='subscribed_publishers',
-        limit_choices_to={'groups__name': 'Reader'},
+        limit_choices_to=reader_choices,
         blank=True,
     )
 
@@ -124,7 +176,7 @@ class Newsletter(models.Model):
         CustomUser,
         on_delete=models.CASCADE,
         related_name='newsletters',
-        limit_choices_to={'groups__name': 'Journalist'}
+        limit_choices_to=journalist_choices
     )
     publisher = models.ForeignKey(
         Publisher,
@@ -150,6 +202,24 @@ class Newsletter(models.Model):
         return reverse('core:article_detail', kwargs={'pk': self.pk})
 
 
+# Extra attempts, each with a random suffix, when an auto-generated slug collides
+SLUG_COLLISION_RETRIES = 3
+
+
+class ArticleQuerySet(models.QuerySet):
+    """Reusable filters for Article, exposed on ``Article.objects``."""
+
+    def published(self):
+        return self.filter(status='published')
+
+    def published_feed(self):
+        """
+        Published articles with author and publisher joined in the same query,
+        ready for the nested author/publisher of the list serializers.
+        """
+        return self.published().select_related('author', 'publisher')
+
+
 class Article(models.Model):
     """
     Core news article model with complete editorial workflow support.
@@ -196,12 +266,13 @@ class Article(models.Model):
         CustomUser,
         on_delete=models.CASCADE,
         related_name='articles',
-        limit_choices_to={'groups__name': 'Journalist'}
+        limit_choices_to=journalist_choices
     )
 
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     published_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)  # Drives API ETags
 
     approved_by = models.ForeignKey(
         CustomUser,
@@ -209,7 +280,7 @@ class Article(models.Model):
         null=True,
         blank=True,
         related_name='approved_articles',
-        limit_choices_to={'groups__name': 'Editor'}
+        limit_choices_to=editor_choices
     )
     approved_at = models.DateTimeField(null=True, blank=True)
     notifications_sent = models.BooleanField(default=False)  # Prevents duplicate notifications
@@ -223,8 +294,17 @@ class Article(models.Model):
         related_name='lead_articles'
     )
 
+    objects = ArticleQuerySet.as_manager()
+
     class Meta:
         ordering = ['-published_at', '-created_at']
+        indexes = [
+            # Public lists / feeds: WHERE status='published' ORDER BY published_at DESC
+            models.Index(fields=['status', '-published_at'], name='art_status_pubat_idx'),
+            # Per-publisher and per-journalist published lists
+            models.Index(fields=['publisher', 'status', '-published_at'], name='art_pub_status_pubat_idx'),
+            models.Index(fields=['author', 'status', '-published_at'], name='art_auth_status_pubat_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -244,7 +324,12 @@ class Article(models.Model):
             self.approved_by = approved_by
             self.approved_at = timezone.now()
             self.notifications_sent = False
-            self.save()
+            # Only the workflow columns changed; updated_at is listed so the
+            # auto_now timestamp (and the API ETag) still moves
+            self.save(update_fields=[
+                'status', 'published_at', 'approved_by', 'approved_at',
+                'notifications_sent', 'updated_at',
+            ])
 
     def get_absolute_url(self):
         """Returns the canonical URL for viewing this article."""
@@ -254,16 +339,32 @@ class Article(models.Model):
         """
         Custom save method that auto-generates a unique slug from the title
         if no slug is provided.
+
+        The slug is claimed optimistically: the write relies on the UNIQUE
+        index on ``slug`` and, on a collision, retries with a short random
+        suffix. No lookups are made beforehand, and concurrent saves of
+        same-titled articles can't both pick the same slug. Integrity errors
+        not caused by a taken slug are raised without retrying.
         """
-        if not self.slug and self.title:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Article.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if self.slug or not self.title or (update_fields is not None and 'slug' not in update_fields):
+            super().save(*args, **kwargs)
+            return
+
+        base_slug = slugify(self.title)
+        self.slug = base_slug
+        for retry in range(SLUG_COLLISION_RETRIES + 1):
+            try:
+                # Savepoint, so a collision doesn't break an enclosing transaction
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                # Only a taken slug is worth another try; re-raise FK / NOT NULL
+                # violations (and the final collision) as they are
+                if retry == SLUG_COLLISION_RETRIES or not Article.objects.filter(slug=self.slug).exists():
+                    raise
+                self.slug = f"{base_slug}-{secrets.token_hex(3)}"
 
 
 class Category(models.Model):
@@ -313,6 +414,7 @@ class ApiClient(models.Model):
     api_key = models.CharField(
         max_length=64,
         unique=True,
+        db_index=True,  # looked up on every API-key request (the unique index serves it)
         editable=False,
         blank=True,   # generated automatically
         help_text="Long random token used for API authentication"
@@ -321,26 +423,30 @@ class ApiClient(models.Model):
         CustomUser,
         on_delete=models.CASCADE,
         related_name='api_clients',
-        limit_choices_to={'groups__name': 'Reader'},
+        limit_choices_to=reader_choices,
         help_text="The reader account whose subscriptions this API client can access"
     )
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     last_used_at = models.DateTimeField(null=True, blank=True)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Generate the key up front so creating a client needs no full_clean();
+        # skipped when loaded with api_key deferred (reading it would query)
+        if 'api_key' in self.__dict__ and not self.api_key:
+            self.api_key = secrets.token_urlsafe(48)
+
     def __str__(self):
         return f"{self.name} ({self.user.username})"
 
     def clean(self):
-        """Generate API key if not set and validate its length."""
-        if not self.api_key:
-            import secrets
-            self.api_key = secrets.token_urlsafe(48)
+        """Validate the API key length."""
         if len(self.api_key) < 40:
             raise ValidationError("API key is too short")
 
     def save(self, *args, **kwargs):
-        """Ensure full_clean() is called on creation to generate key."""
-        if not self.pk:  # only on create
-            self.full_clean()  # calls clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        """Check the key length on creation (cheaper than a full_clean())."""
+        if self._state.adding:
+            self.clean()
+        super().save(*args, **kwargs)
@@ -0,0 +1,14 @@
+# core/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class PublishedArticleCursorPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination for published-article feeds, newest first.
+
+    Unlike page-number pagination, each page is fetched with
+    ``WHERE published_at < <cursor> ORDER BY published_at DESC LIMIT n``
+    instead of an OFFSET, so deep pages cost the same as the first one
+    and response size stays bounded. Page size follows ``PAGE_SIZE``.
+    """
+    ordering = '-published_at'
@@ -12,8 +12,24 @@ class IsApiClientForSubscribedContent(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         # For single object retrieval (if needed later)
-        if hasattr(obj, 'publisher') and obj.publisher:
-            return request.user.subscribed_publishers.filter(pk=obj.publisher.pk).exists()
-        if hasattr(obj, 'author') and obj.author.is_journalist:
-            return request.user.subscribed_journalists.filter(pk=obj.author.pk).exists()
-        return False
\ No newline at end of file
+        publisher_ids, journalist_ids = _subscribed_ids(request)
+        if getattr(obj, 'publisher_id', None):
+            return obj.publisher_id in publisher_ids
+        if getattr(obj, 'author_id', None):
+            return obj.author_id in journalist_ids
+        return False
+
+
+def _subscribed_ids(request):
+    """
+    Return the user's subscribed publisher IDs and followed journalist IDs as
+    sets, memoized on the request so checking many objects costs two queries.
+    """
+    ids = getattr(request, '_subscribed_ids', None)
+    if ids is None:
+        ids = (
+            set(request.user.subscribed_publishers.values_list('pk', flat=True)),
+            set(request.user.subscribed_journalists.values_list('pk', flat=True)),
+        )
+        request._subscribed_ids = ids
+    return ids
@@ -0,0 +1,191 @@
+# core/querysets.py
+"""
+Shared, pre-optimized querysets for published articles.
+
+The API exposes several near-identical list endpoints (per publisher, per
+journalist, personalized feeds). They all build their querysets here so
+select_related / only() tuning and filtering rules live in one place.
+"""
+
+from django.db.models import Exists, OuterRef, Q
+from django.http import Http404
+
+from .models import Article, Publisher, CustomUser
+
+# Columns read by ArticleListSerializer (incl. nested author/publisher);
+# everything else — notably the large `content` TEXT column — is deferred
+ARTICLE_LIST_FIELDS = (
+    'id', 'title', 'slug', 'excerpt', 'status', 'published_at', 'created_at',
+    'author', 'author__id', 'author__username', 'author__first_name', 'author__last_name',
+    'publisher', 'publisher__id', 'publisher__name', 'publisher__description', 'publisher__website',
+)
+
+
+# Same columns as ARTICLE_LIST_FIELDS, flattened for values() querysets
+# consumed by ArticleListValuesSerializer
+ARTICLE_LIST_VALUES = tuple(
+    field for field in ARTICLE_LIST_FIELDS if field not in ('author', 'publisher')
+)
+
+
+# Columns rendered by the HTML article cards (home page, article list, feed):
+# author/publisher names and the lead image, but never `content`
+ARTICLE_CARD_FIELDS = (
+    'id', 'title', 'excerpt', 'status', 'published_at',
+    'author', 'author__username', 'author__first_name', 'author__last_name',
+    'publisher', 'publisher__name',
+    'lead_image', 'lead_image__image', 'lead_image__alt_text',
+)
+
+
+# Above this many subscriptions on one side, the feed filter switches from a
+# literal IN (...) list to an EXISTS probe of the M2M through table
+SUBSCRIPTION_IN_LIST_LIMIT = 500
+
+
+def published_articles(fields=None):
+    """
+    Return published articles with author and publisher joined, newest first.
+
+    Args:
+        fields: Optional iterable of field names to restrict the SELECT to
+            (e.g. ARTICLE_LIST_FIELDS for summary serializers)
+    """
+    qs = Article.objects.published_feed()
+    if fields:
+        qs = qs.only(*fields)
+    return qs.order_by('-published_at')
+
+
+def published_article_cards():
+    """
+    Published articles for the HTML card templates, newest first: author,
+    publisher and lead image joined, restricted to ARTICLE_CARD_FIELDS.
+    """
+    return published_articles(ARTICLE_CARD_FIELDS).select_related('lead_image')
+
+
+def subscription_filter(publisher_ids, journalist_ids):
+    """
+    Build the Q filter matching articles from subscribed publishers or
+    followed independent journalists.
+
+    Both ID collections are expected to be materialized lists so Django emits
+    flat ``IN (1, 2, 3)`` clauses instead of subqueries. Empty lists are left
+    out entirely; if both are empty the filter matches nothing.
+    """
+    condition = Q(pk__in=[])
+    if publisher_ids:
+        condition |= Q(publisher_id__in=publisher_ids)
+    if journalist_ids:
+        condition |= Q(author_id__in=journalist_ids, publisher__isnull=True)
+    return condition
+
+
+def _subscription_conditions(user):
+    """
+    Return ``(publisher_condition, journalist_condition)`` for a reader's
+    subscriptions; a side is None when the reader has no subscriptions there.
+
+    Small subscription sets are materialized into ID lists (see
+    subscription_filter). When a side exceeds SUBSCRIPTION_IN_LIST_LIMIT, that
+    side becomes an EXISTS subquery on the M2M through table instead, which
+    the unique (publisher, customuser) / (from_customuser, to_customuser)
+    indexes answer without building a huge IN list.
+    """
+    limit = SUBSCRIPTION_IN_LIST_LIMIT
+    pub_ids = list(user.subscribed_publishers.values_list('id', flat=True)[:limit + 1])
+    journ_ids = list(user.subscribed_journalists.values_list('id', flat=True)[:limit + 1])
+
+    pub_condition = journ_condition = None
+    if len(pub_ids) > limit:
+        pub_condition = Q(Exists(Publisher.subscribed_readers.through.objects.filter(
+            customuser_id=user.pk,
+            publisher_id=OuterRef('publisher_id'),
+        )))
+    elif pub_ids:
+        pub_condition = subscription_filter(pub_ids, [])
+    if len(journ_ids) > limit:
+        journ_condition = Q(
+            Exists(CustomUser.subscribed_journalists.through.objects.filter(
+                from_customuser_id=user.pk,
+                to_customuser_id=OuterRef('author_id'),
+            )),
+            publisher__isnull=True,
+        )
+    elif journ_ids:
+        journ_condition = subscription_filter([], journ_ids)
+    return pub_condition, journ_condition
+
+
+def subscribed_articles_filter(user):
+    """
+    Build the feed filter for a reader's subscriptions, or None if they have none.
+
+    Both sides are ORed into one WHERE clause, so the result can still be
+    filtered further (e.g. by cursor pagination).
+    """
+    conditions = [c for c in _subscription_conditions(user) if c is not None]
+    if not conditions:
+        return None
+    condition = conditions[0]
+    for other in conditions[1:]:
+        condition |= other
+    return condition
+
+
+def subscribed_articles_union(user, fields=None):
+    """
+    Published articles from a reader's subscriptions as a UNION of one query
+    per side, newest first, or None if they have no subscriptions.
+
+    Each branch is a plain indexed lookup (publisher_id IN ... / author_id IN
+    ... AND publisher_id IS NULL), so the planner never has to merge both
+    sides of an OR. The result only supports ordering, slicing and count(),
+    which is all page-number pagination needs.
+    """
+    branches = [
+        published_articles(fields).filter(condition).order_by()
+        for condition in _subscription_conditions(user)
+        if condition is not None
+    ]
+    if not branches:
+        return None
+    first, *others = branches
+    # The sides are disjoint (publisher set vs NULL), so UNION ALL skips the dedupe
+    return first.union(*others, all=True).order_by('-published_at')
+
+
+def published_by_publisher(pk, fields=None):
+    """
+    Published articles for one publisher.
+
+    Raises Http404 if the publisher does not exist (checked with exists(),
+    without hydrating the Publisher instance).
+    """
+    if not Publisher.objects.filter(pk=pk).exists():
+        raise Http404("No Publisher matches the given query.")
+    return published_articles(fields).filter(publisher_id=pk)
+
+
+def published_by_journalist(username, fields=None):
+    """
+    Published articles by one author, independent and publisher-affiliated.
+
+    Raises Http404 if no user has the given username (resolved by fetching
+    only the ``id`` column).
+    """
+    user_id = CustomUser.objects.filter(username=username).values_list('pk', flat=True).first()
+    if user_id is None:
+        raise Http404("No CustomUser matches the given query.")
+    return published_articles(fields).filter(author_id=user_id)
+
+
+def published_article_values():
+    """
+    Published articles as plain dicts (newest first), for list endpoints that
+    serialize with ArticleListValuesSerializer and skip model instantiation.
+    """
+    return Article.objects.published() \
+        .order_by('-published_at') \
+        .values(*ARTICLE_LIST_VALUES)
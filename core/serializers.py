@@ -66,6 +66,45 @@ class ArticleListSerializer(serializers.ModelSerializer):
         read_only_fields = ['status', 'published_at']
 
 
+class ArticleListValuesSerializer(serializers.Serializer):
+    """
+    Read-only twin of ArticleListSerializer that works on ``values()`` dicts.
+
+    Produces exactly the same representation, but reads flat
+    ``author__*`` / ``publisher__*`` keys instead of model instances, so
+    large lists are serialized without instantiating Article, CustomUser
+    and Publisher objects for every row.
+    """
+
+    id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    slug = serializers.CharField(read_only=True)
+    excerpt = serializers.CharField(read_only=True)
+    publisher = serializers.SerializerMethodField()
+    author = serializers.SerializerMethodField()
+    status = serializers.CharField(read_only=True)
+    published_at = serializers.DateTimeField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+    def get_publisher(self, row):
+        if row['publisher__id'] is None:
+            return None
+        return {
+            'id': row['publisher__id'],
+            'name': row['publisher__name'],
+            'description': row['publisher__description'],
+            'website': row['publisher__website'],
+        }
+
+    def get_author(self, row):
+        return {
+            'id': row['author__id'],
+            'username': row['author__username'],
+            'first_name': row['author__first_name'],
+            'last_name': row['author__last_name'],
+        }
+
+
 class ArticleDetailSerializer(ArticleListSerializer):
     """
     Detailed serializer for a single article.
@@ -1,10 +1,12 @@
 # core/signals.py
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_save, post_delete
 from django.dispatch import receiver
-from django.core.mail import send_mass_mail
-from django.conf import settings
+from django.core.cache import cache
 
-from .models import Article
+from .authentication import api_key_cache_key
+from .caching import invalidate_article_cache, invalidate_feed_cache
+from .models import Article, ApiClient, CustomUser, Publisher
+from .tasks import notify_article_published, run_after_commit
 
 @receiver(post_save, sender=Article)
 def notify_and_tweet_on_publish(sender, instance, created, **kwargs):
@@ -12,26 +14,63 @@ def notify_and_tweet_on_publish(sender, instance, created, **kwargs):
     if created or instance.status != 'published' or instance.notifications_sent:
         return
 
-    # Email notifications (defensive)
-    recipients = set()
-    if instance.publisher:
-        recipients.update(instance.publisher.subscribed_readers.all())
-    if instance.author and instance.author.is_journalist:
-        recipients.update(instance.author.journalist_followers.all())
-
-    if recipients and settings.EMAIL_HOST:  # Check config defensively
-        subject = f"New Article: {instance.title}"
-        message = (
-            f"New article '{instance.title}' by {instance.author.get_full_name() or instance.author.username}.\n\n"
-            f"Read here: {settings.SITE_URL}{instance.get_absolute_url()}\n\n"
-            f"Best,\nNews Platform"
-        )
-        emails = [(subject, message, settings.DEFAULT_FROM_EMAIL, [u.email]) for u in recipients if u.email]
-        try:
-            send_mass_mail(emails, fail_silently=False)
-        except Exception as e:
-            print(f"Email notification failed: {e}")
-
-    # Tweet removed (auth broken); set flag
+    # Tweet removed (auth broken). Claim the flag with a conditional UPDATE:
+    # no save() / post_save re-entry, and concurrent saves can't both notify
+    claimed = Article.objects.filter(pk=instance.pk, notifications_sent=False) \
+        .update(notifications_sent=True)
     instance.notifications_sent = True
-    instance.save(update_fields=['notifications_sent'])
\ No newline at end of file
+    if not claimed:
+        return
+
+    # Email notifications run in the background once the publish is committed,
+    # so SMTP latency never blocks the request that published the article
+    run_after_commit(notify_article_published, instance.pk)
+
+
+@receiver([post_save, post_delete], sender=ApiClient)
+def invalidate_api_key_cache(sender, instance, **kwargs):
+    """Drop the cached lookup so deactivated or deleted clients lose access immediately."""
+    if instance.api_key:
+        cache.delete(api_key_cache_key(instance.api_key))
+
+
+@receiver([post_save, post_delete], sender=Article)
+def invalidate_cached_article_lists(sender, instance, **kwargs):
+    """Expire cached public article lists whenever an article changes."""
+    invalidate_article_cache()
+
+
+@receiver(m2m_changed, sender=CustomUser.groups.through)
+def clear_cached_group_names(sender, instance, action, **kwargs):
+    """Forget a user's memoized group names once their membership changes."""
+    if action.startswith('post_') and isinstance(instance, CustomUser):
+        instance.__dict__.pop('group_names', None)
+
+
+def _expire_subscribed_feeds(action, instance, instance_is_reader, pk_set, readers):
+    """
+    Shared body of the subscription m2m_changed receivers below.
+
+    When the change was made from the reader's side, only that reader is
+    affected; otherwise ``pk_set`` holds the readers, or for clear() they are
+    read from ``readers()`` before the rows go away.
+    """
+    if instance_is_reader:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate_feed_cache([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        invalidate_feed_cache(pk_set)
+    elif action == 'pre_clear':
+        invalidate_feed_cache(readers().values_list('pk', flat=True))
+
+
+@receiver(m2m_changed, sender=Publisher.subscribed_readers.through)
+def expire_feeds_on_publisher_subscription(sender, instance, action, reverse, pk_set, **kwargs):
+    """Expire cached subscribed feeds of readers whose publisher subscriptions changed."""
+    _expire_subscribed_feeds(action, instance, reverse, pk_set, lambda: instance.subscribed_readers)
+
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_journalists.through)
+def expire_feeds_on_journalist_follow(sender, instance, action, reverse, pk_set, **kwargs):
+    """Expire cached subscribed feeds of readers whose followed journalists changed."""
+    _expire_subscribed_feeds(action, instance, not reverse, pk_set, lambda: instance.journalist_followers)
@@ -0,0 +1,166 @@
+# core/tasks.py
+"""
+Background jobs for work that should not block the request/response cycle.
+
+Jobs are started in a background thread once the surrounding database
+transaction commits, so they always see committed data and never delay
+the response that triggered them. The threads are not daemonic: on
+shutdown the interpreter waits for running jobs instead of dropping
+notifications whose ``notifications_sent`` flag is already claimed.
+"""
+
+import threading
+from itertools import islice
+
+import requests
+
+from django.conf import settings
+from django.core.mail import get_connection, send_mass_mail
+from django.db import connections, transaction
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .models import Article, CustomUser
+
+# Messages handed to the mail backend per send_mass_mail() call
+EMAIL_BATCH_SIZE = 500
+
+# Shared session for X API calls: keeps connections (and TLS sessions) alive
+# between posts. Connection errors are retried with backoff; HTTP status
+# retries are limited to 429/503, where the tweet was certainly not created.
+# Read errors are never retried: the request may already have been processed.
+_X_SESSION = requests.Session()
+_X_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False,
+    ),
+))
+
+
+def run_after_commit(func, *args):
+    """Run ``func(*args)`` in a background thread after the current transaction commits."""
+    def start():
+        threading.Thread(target=_run_job, args=(func, *args)).start()
+    transaction.on_commit(start)
+
+
+def _run_job(func, *args):
+    try:
+        func(*args)
+    finally:
+        # Worker threads get their own DB connections; don't leak them
+        connections.close_all()
+
+
+def batched(iterable, size):
+    """Yield lists of up to ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def notify_article_published(article_id):
+    """
+    Email subscribers of the article's publisher and followers of its author.
+
+    Only email addresses are fetched, with blank ones filtered and duplicates
+    collapsed in SQL (UNION of subscribers and followers). Messages go out in
+    EMAIL_BATCH_SIZE batches over a single reused mail connection, so a
+    failing batch doesn't drop the rest.
+    """
+    if not settings.EMAIL_HOST:  # Check config defensively
+        return
+
+    article = Article.objects.select_related('author').get(pk=article_id)
+
+    recipient_querysets = []
+    if article.publisher_id:
+        recipient_querysets.append(
+            CustomUser.objects.filter(subscribed_publishers=article.publisher_id)
+        )
+    if article.author and article.author.is_journalist:
+        recipient_querysets.append(article.author.journalist_followers.all())
+    if not recipient_querysets:
+        return
+
+    # DISTINCT covers the single-source case, where there is no UNION to dedupe
+    first, *others = (
+        qs.exclude(email='').values_list('email', flat=True).distinct()
+        for qs in recipient_querysets
+    )
+    recipient_emails = list(first.union(*others))
+    if not recipient_emails:
+        return
+
+    # Read defensively: the notifications flag is already claimed, so a
+    # missing setting must not abort the job
+    site_url = getattr(settings, 'SITE_URL', '')
+    subject = f"New Article: {article.title}"
+    message = (
+        f"New article '{article.title}' by {article.author.get_full_name() or article.author.username}.\n\n"
+        f"Read here: {site_url}{article.get_absolute_url()}\n\n"
+        f"Best,\nNews Platform"
+    )
+    emails = ((subject, message, settings.DEFAULT_FROM_EMAIL, [email]) for email in recipient_emails)
+
+    with get_connection() as connection:
+        for batch in batched(emails, EMAIL_BATCH_SIZE):
+            try:
+                send_mass_mail(batch, fail_silently=False, connection=connection)
+            except Exception as e:
+                print(f"Email notification batch failed: {e}")
+
+
+def post_article_to_x(article_id):
+    """
+    Tweet a newly published article to X (Twitter).
+
+    Requirements:
+    - TWITTER_BEARER_TOKEN must be set in Django settings
+    - Article must have a valid get_absolute_url()
+
+    Posts a concise message (≤280 characters) including:
+    - Article title
+    - Author username
+    - Full link
+    - Basic hashtags
+
+    Logs success/failure to console (no user-facing feedback).
+    """
+    if not hasattr(settings, 'TWITTER_BEARER_TOKEN'):
+        print("Twitter/X credentials not configured")
+        return
+
+    article = Article.objects.select_related('author').get(pk=article_id)
+
+    url = "https://api.twitter.com/2/tweets"
+    headers = {
+        "Authorization": f"Bearer {settings.TWITTER_BEARER_TOKEN}",
+        "Content-Type": "application/json"
+    }
+
+    site_url = getattr(settings, 'SITE_URL', '')
+    text = (
+        f"New article: {article.title}\n"
+        f"by {article.author.username}\n"
+        f"{site_url}{article.get_absolute_url()}\n"
+        f"#News #Journalism"
+    )[:280]
+
+    payload = {"text": text}
+
+    try:
+        response = _X_SESSION.post(url, json=payload, headers=headers, timeout=(3.05, 10))
+        if response.status_code == 201:
+            print("Successfully posted to X")
+        else:
+            print(f"Failed to post to X: {response.status_code} - {response.text}")
+    except Exception as e:
+        print(f"Error posting to X: {e}")
@@ -1,13 +1,25 @@
 # core/tests.py
 
+from django.core import mail
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.http import Http404
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
 from datetime import timedelta
+import json
+from unittest import mock
+from urllib.parse import parse_qs
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase
 
+from .api_views import PublicJournalistArticlesView
 from .models import CustomUser, Publisher, Article, ApiClient, Group
+from .querysets import ARTICLE_LIST_FIELDS, published_by_journalist, published_by_publisher
+from .tasks import notify_article_published
+from .views import ArticleListView
 
 
 class SubscribedArticlesFeedAPITest(APITestCase):
@@ -17,6 +29,9 @@ class SubscribedArticlesFeedAPITest(APITestCase):
     """
 
     def setUp(self):
+        # Cached API-key lookups / usage markers must not leak between tests
+        cache.clear()
+
         # Groups
         self.reader_group, _ = Group.objects.get_or_create(name='Reader')
         self.journalist_group, _ = Group.objects.get_or_create(name='Journalist')
@@ -48,21 +63,14 @@ class SubscribedArticlesFeedAPITest(APITestCase):
 
         self.publisher_yes.journalists.add(self.journ_publisher)
 
-        # Articles - published
+        # Articles - published (inserted in one bulk_create; titles are unique,
+        # so slugs are precomputed and Article.save() is not needed)
         now = timezone.now()
 
-        def create_article(title, author, publisher=None, delta_hours=0):
-            slug = slugify(title)
-            # Make slug unique if needed
-            base_slug = slug
-            counter = 1
-            while Article.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-
-            return Article.objects.create(
+        def build_article(title, author, publisher=None, delta_hours=0):
+            return Article(
                 title=title,
-                slug=slug,
+                slug=slugify(title),
                 content=f"Content for {title}",
                 excerpt=f"Excerpt for {title}",
                 author=author,
@@ -71,34 +79,41 @@ class SubscribedArticlesFeedAPITest(APITestCase):
                 published_at=now - timedelta(hours=delta_hours)
             )
 
-        self.article_pub_yes = create_article(
+        self.article_pub_yes = build_article(
             "News from subscribed publisher",
             self.journ_publisher,
             self.publisher_yes,
             delta_hours=3
         )
 
-        self.article_indep_followed = create_article(
+        self.article_indep_followed = build_article(
             "Independent article - followed journalist",
             self.journ_independent,
             None,
             delta_hours=2
         )
 
-        self.article_pub_no = create_article(
+        self.article_pub_no = build_article(
             "News from non-subscribed publisher",
             self.journ_publisher,
             self.publisher_no,
             delta_hours=1
         )
 
-        self.article_indep_not_followed = create_article(
+        self.article_indep_not_followed = build_article(
             "Independent - not followed",
             self.journ_publisher,  # different journalist
             None,
             delta_hours=0.5
         )
 
+        Article.objects.bulk_create([
+            self.article_pub_yes,
+            self.article_indep_followed,
+            self.article_pub_no,
+            self.article_indep_not_followed,
+        ], batch_size=500)
+
         # API Client
         self.api_client = ApiClient.objects.create(
             name="Test Client App",
@@ -137,7 +152,7 @@ class SubscribedArticlesFeedAPITest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        titles = {item['title'] for item in response.data}
+        titles = {item['title'] for item in response.data['results']}
 
         self.assertIn("News from subscribed publisher", titles)
         self.assertIn("Independent article - followed journalist", titles)
@@ -153,7 +168,7 @@ class SubscribedArticlesFeedAPITest(APITestCase):
         response = self.client.get(url, HTTP_X_API_KEY=self.api_key)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
 
     def test_invalid_api_key_returns_401(self):
         url = self.get_feed_url()
@@ -183,7 +198,7 @@ class SubscribedArticlesFeedAPITest(APITestCase):
         url = self.get_feed_url()
         response = self.client.get(url, HTTP_X_API_KEY=self.api_key)
 
-        titles = {item['title'] for item in response.data}
+        titles = {item['title'] for item in response.data['results']}
         self.assertNotIn("This is still a draft", titles)
 
     def test_last_used_at_is_updated_on_successful_request(self):
@@ -199,4 +214,301 @@ class SubscribedArticlesFeedAPITest(APITestCase):
         after = self.api_client.last_used_at
 
         self.assertIsNotNone(after)
-        self.assertGreater(after, before or timezone.now() - timedelta(seconds=30))
\ No newline at end of file
+        self.assertGreater(after, before or timezone.now() - timedelta(seconds=30))
+
+    def test_repeated_request_is_served_from_cache(self):
+        url = self.get_feed_url()
+        self.client.get(url, HTTP_X_API_KEY=self.api_key)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_X_API_KEY=self.api_key)
+
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_subscription_change_invalidates_cached_feed(self):
+        url = self.get_feed_url()
+        self.client.get(url, HTTP_X_API_KEY=self.api_key)
+
+        self.publisher_no.subscribed_readers.add(self.reader)
+        response = self.client.get(url, HTTP_X_API_KEY=self.api_key)
+
+        titles = {item['title'] for item in response.data['results']}
+        self.assertIn("News from non-subscribed publisher", titles)
+
+
+class PublicArticleListCacheTest(APITestCase):
+    """
+    Tests for response caching on the public publisher article list
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        journalist_group, _ = Group.objects.get_or_create(name='Journalist')
+        self.journalist = CustomUser.objects.create_user(
+            username='journ_cache',
+            password='testpass123'
+        )
+        self.journalist.groups.add(journalist_group)
+        self.publisher = Publisher.objects.create(name="Cached Publisher")
+
+        Article.objects.create(
+            title="First cached article",
+            content="Content",
+            author=self.journalist,
+            publisher=self.publisher,
+            status='published',
+            published_at=timezone.now()
+        )
+        self.url = reverse('core:api_publisher_articles', kwargs={'pk': self.publisher.pk})
+
+    def test_repeated_request_is_served_from_cache(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_saving_an_article_invalidates_cached_list(self):
+        self.client.get(self.url)
+
+        Article.objects.create(
+            title="Second cached article",
+            content="Content",
+            author=self.journalist,
+            publisher=self.publisher,
+            status='published',
+            published_at=timezone.now()
+        )
+        response = self.client.get(self.url)
+
+        titles = {item['title'] for item in response.data['results']}
+        self.assertIn("Second cached article", titles)
+
+
+class ArticleListQuerysetTest(APITestCase):
+    """
+    List serializer querysets must not load the large `content` column
+    """
+
+    def setUp(self):
+        self.journalist = CustomUser.objects.create_user(
+            username='journ_defer',
+            password='testpass123'
+        )
+        self.publisher = Publisher.objects.create(name="Deferred Publisher")
+        Article.objects.create(
+            title="Deferred article",
+            content="Large body",
+            author=self.journalist,
+            publisher=self.publisher,
+            status='published',
+            published_at=timezone.now()
+        )
+
+    def test_content_is_deferred(self):
+        querysets = [
+            published_by_publisher(self.publisher.pk, ARTICLE_LIST_FIELDS),
+            published_by_journalist('journ_defer', ARTICLE_LIST_FIELDS),
+        ]
+        for qs in querysets:
+            self.assertIn('content', qs.get().get_deferred_fields())
+
+
+class UnpaginatedJournalistArticlesTest(APITestCase):
+    """
+    Tests for the streamed, unpaginated fallback of PublicJournalistArticlesView
+    """
+
+    class UnpaginatedView(PublicJournalistArticlesView):
+        pagination_class = None
+
+    def setUp(self):
+        journalist_group, _ = Group.objects.get_or_create(name='Journalist')
+        self.journalist = CustomUser.objects.create_user(
+            username='journ_stream',
+            password='testpass123'
+        )
+        self.journalist.groups.add(journalist_group)
+
+        for i in range(3):
+            Article.objects.create(
+                title=f"Streamed article {i}",
+                content="Content",
+                author=self.journalist,
+                status='published',
+                published_at=timezone.now()
+            )
+
+    def test_count_matches_results_without_count_query(self):
+        request = APIRequestFactory().get('/')
+
+        with self.assertNumQueries(2):  # journalist lookup + article rows, no COUNT(*)
+            response = self.UnpaginatedView.as_view()(request, username='journ_stream')
+            data = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(len(data['results']), 3)
+        self.assertEqual(data['journalist']['username'], 'journ_stream')
+
+
+class GroupNamesTest(APITestCase):
+    """
+    Role checks must reflect group membership changes on the next load
+    """
+
+    def setUp(self):
+        self.editor_group, _ = Group.objects.get_or_create(name='Editor')
+        self.user = CustomUser.objects.create_user(username='role_user', password='testpass123')
+        self.user.groups.add(self.editor_group)
+
+    def test_through_table_delete_is_seen_by_fresh_instance(self):
+        self.assertTrue(CustomUser.objects.get(pk=self.user.pk).is_editor)
+
+        CustomUser.groups.through.objects.filter(customuser_id=self.user.pk).delete()
+
+        self.assertFalse(CustomUser.objects.get(pk=self.user.pk).is_editor)
+
+    def test_groups_change_clears_memoized_names(self):
+        self.assertTrue(self.user.is_editor)
+
+        self.user.groups.remove(self.editor_group)
+
+        self.assertFalse(self.user.is_editor)
+
+
+@override_settings(EMAIL_HOST='smtp.example.com', SITE_URL='http://testserver')
+class PublishNotificationTest(APITestCase):
+    """
+    Tests for the publish signal and the notify_article_published job
+    """
+
+    def setUp(self):
+        journalist_group, _ = Group.objects.get_or_create(name='Journalist')
+        editor_group, _ = Group.objects.get_or_create(name='Editor')
+        self.journalist = CustomUser.objects.create_user(username='journ_notify', password='testpass123')
+        self.journalist.groups.add(journalist_group)
+        self.editor = CustomUser.objects.create_user(username='editor_notify', password='testpass123')
+        self.editor.groups.add(editor_group)
+        self.publisher = Publisher.objects.create(name="Notify Publisher")
+
+        # both_reader is on both lists and must get a single email;
+        # blank_reader has no address and is skipped
+        readers = {
+            name: CustomUser.objects.create_user(username=name, password='testpass123', email=email)
+            for name, email in [
+                ('pub_reader', 'pub@example.com'),
+                ('follow_reader', 'follow@example.com'),
+                ('both_reader', 'both@example.com'),
+                ('blank_reader', ''),
+            ]
+        }
+        self.publisher.subscribed_readers.add(
+            readers['pub_reader'], readers['both_reader'], readers['blank_reader']
+        )
+        self.journalist.journalist_followers.add(readers['follow_reader'], readers['both_reader'])
+
+        self.article = Article.objects.create(
+            title="Notify article",
+            content="Content",
+            author=self.journalist,
+            publisher=self.publisher,
+            status='pending'
+        )
+
+    def test_publish_claims_flag_and_schedules_one_job(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.article.publish(approved_by=self.editor)
+            self.article.save()  # a later save must not schedule again
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertTrue(Article.objects.get(pk=self.article.pk).notifications_sent)
+
+    def test_each_recipient_is_emailed_once(self):
+        notify_article_published(self.article.pk)
+
+        recipients = sorted(message.to[0] for message in mail.outbox)
+        self.assertEqual(recipients, ['both@example.com', 'follow@example.com', 'pub@example.com'])
+
+    @mock.patch('core.tasks.EMAIL_BATCH_SIZE', 2)
+    def test_emails_are_sent_in_batches(self):
+        with mock.patch('core.tasks.send_mass_mail', wraps=mail.send_mass_mail) as send:
+            notify_article_published(self.article.pk)
+
+        self.assertEqual([len(call.args[0]) for call in send.call_args_list], [2, 1])
+        self.assertEqual(len(mail.outbox), 3)
+
+
+class ArticleSlugTest(APITestCase):
+    """
+    Tests for the optimistic slug claim in Article.save()
+    """
+
+    def setUp(self):
+        self.journalist = CustomUser.objects.create_user(username='journ_slug', password='testpass123')
+
+    def test_colliding_title_gets_suffixed_slug(self):
+        first = Article.objects.create(title="Same Title", content="Content", author=self.journalist)
+        second = Article.objects.create(title="Same Title", content="Content", author=self.journalist)
+
+        self.assertEqual(first.slug, 'same-title')
+        self.assertRegex(second.slug, r'^same-title-[0-9a-f]{6}$')
+
+    def test_other_integrity_errors_are_not_retried(self):
+        with mock.patch('core.models.secrets.token_hex') as token_hex:
+            with self.assertRaises(IntegrityError):
+                Article.objects.create(title="No Author", content="Content", author_id=None)
+
+        token_hex.assert_not_called()
+
+
+class ArticleListKeysetPaginationTest(APITestCase):
+    """
+    Tests for the keyset (?after=&after_id=) pagination of ArticleListView
+    """
+
+    def setUp(self):
+        cache.clear()
+        journalist = CustomUser.objects.create_user(username='journ_pages', password='testpass123')
+        now = timezone.now()
+        self.articles = [
+            Article.objects.create(
+                title=f"Paged article {i}",
+                content="Content",
+                author=journalist,
+                status='published',
+                published_at=now - timedelta(hours=i)
+            )
+            for i in range(ArticleListView.page_size + 3)
+        ]
+
+    def get_context(self, query=''):
+        view = ArticleListView()
+        view.setup(APIRequestFactory().get('/articles/' + query))
+        view.object_list = view.get_queryset()
+        return view.get_context_data()
+
+    def test_first_page_links_to_older_articles(self):
+        context = self.get_context()
+
+        self.assertEqual(list(context['articles']), self.articles[:ArticleListView.page_size])
+        self.assertTrue(context['is_first_page'])  # no "Newest" link
+        self.assertIsNotNone(context['next_page_url'])
+
+    def test_older_page_continues_after_cursor(self):
+        next_page_url = self.get_context()['next_page_url']
+        cursor = {key: values[0] for key, values in parse_qs(next_page_url[1:]).items()}
+        self.assertEqual(int(cursor['after_id']), self.articles[ArticleListView.page_size - 1].pk)
+
+        context = self.get_context(next_page_url)
+
+        self.assertEqual(list(context['articles']), self.articles[ArticleListView.page_size:])
+        self.assertFalse(context['is_first_page'])  # "Newest" link shown
+        self.assertIsNone(context['next_page_url'])
+        self.assertTrue(context['is_paginated'])
+
+    def test_malformed_cursor_returns_404(self):
+        for query in ('?after=yesterday&after_id=1', '?after=2024-01-01T00:00:00&after_id=x'):
+            with self.assertRaises(Http404):
+                self.get_context(query)
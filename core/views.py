@@ -9,25 +9,29 @@ This module contains:
 """
 
 from django.contrib.auth.views import LoginView
-from django.db.models import Q
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.decorators import login_required, permission_required, user_passes_test
 from django.contrib import messages
 from django.urls import reverse_lazy
-from django.core.mail import send_mass_mail
-from django.conf import settings
-import requests
+from django.http import Http404
+from django.utils.dateparse import parse_datetime
+from django.utils.http import urlencode
 from django.utils import timezone
 from django.views import View
 from django.views.decorators.http import require_POST
 from django.views.generic import DetailView, ListView, CreateView, TemplateView
 from rest_framework import permissions, generics
 
+from .caching import cached_article_data
 from .decorators import journalist_required
 from .models import Article, Publisher, CustomUser, Newsletter
 from .forms import ArticleForm, ArticleApprovalForm, SignUpForm, NewsletterForm
+from .querysets import published_article_cards, subscription_filter
 from .serializers import ArticleListSerializer
+from .tasks import notify_article_published, post_article_to_x, run_after_commit
 
 
 # ──────────────────────────────────────────────────────────────
@@ -84,88 +88,22 @@ def send_notifications_to_subscribers(article):
     - Readers subscribed to the article's publisher (if any)
     - Readers following the article's author (if journalist)
 
-    Skips if:
-    - No email backend configured
-    - No subscribers found
-
-    Uses Django's send_mass_mail() for efficiency.
+    The emails are sent by tasks.notify_article_published from a background
+    thread once the current transaction commits, so the calling request
+    never waits on SMTP.
     """
-    if not settings.EMAIL_HOST:
-        print("Email settings not configured - skipping notifications")
-        return
-
-    subscribers = set()
-
-    if article.publisher:
-        subscribers.update(article.publisher.subscribed_readers.all())
-
-    if article.author and article.author.is_journalist:
-        subscribers.update(article.author.journalist_followers.all())
-
-    if not subscribers:
-        return
-
-    subject = f"New Article: {article.title}"
-    message = (
-        f"A new article '{article.title}' has been published.\n\n"
-        f"Read it here: {settings.SITE_URL}{article.get_absolute_url()}\n\n"
-        f"Best regards,\nThe News Platform Team"
-    )
-
-    messages_to_send = [
-        (subject, message, settings.DEFAULT_FROM_EMAIL, [user.email])
-        for user in subscribers if user.email
-    ]
-
-    try:
-        send_mass_mail(messages_to_send, fail_silently=False)
-    except Exception as e:
-        print(f"Failed to send notification emails: {e}")
+    run_after_commit(notify_article_published, article.pk)
 
 
 def post_to_x(article):
     """
     Publish a tweet announcing a newly published article to X (Twitter).
 
-    Requirements:
-    - TWITTER_BEARER_TOKEN must be set in Django settings
-    - Article must have a valid get_absolute_url()
-
-    Posts a concise message (≤280 characters) including:
-    - Article title
-    - Author username
-    - Full link
-    - Basic hashtags
-
-    Logs success/failure to console (no user-facing feedback).
+    The API call is made by tasks.post_article_to_x from a background thread
+    once the current transaction commits, so the calling request never
+    waits on X.
     """
-    if not hasattr(settings, 'TWITTER_BEARER_TOKEN'):
-        print("Twitter/X credentials not configured")
-        return
-
-    url = "https://api.twitter.com/2/tweets"
-    headers = {
-        "Authorization": f"Bearer {settings.TWITTER_BEARER_TOKEN}",
-        "Content-Type": "application/json"
-    }
-
-    text = (
-        f"New article: {article.title}\n"
-        f"by {article.author.username}\n"
-        f"{settings.SITE_URL}{article.get_absolute_url()}\n"
-        f"#News #Journalism"
-    )[:280]
-
-    payload = {"text": text}
-
-    try:
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
-        if response.status_code == 201:
-            print("Successfully posted to X")
-        else:
-            print(f"Failed to post to X: {response.status_code} - {response.text}")
-    except Exception as e:
-        print(f"Error posting to X: {e}")
+    run_after_commit(post_article_to_x, article.pk)
 
 
 # ──────────────────────────────────────────────────────────────
@@ -304,15 +242,13 @@ def newsletter_update(request, pk):
 # ──────────────────────────────────────────────────────────────
 
 class HomeView(ListView):
-    """Homepage showing latest 6 published featured articles."""
+    """Homepage showing latest 6 published featured articles (cached until an article changes)."""
     model = Article
     template_name = 'core/home.html'
     context_object_name = 'featured_articles'
 
     def get_queryset(self):
-        return Article.objects.filter(status='published') \
-            .select_related('author', 'publisher') \
-            .order_by('-published_at')[:6]
+        return cached_article_data('home-featured', lambda: list(published_article_cards()[:6]))
 
 
 class ArticleDetailView(DetailView):
@@ -337,14 +273,11 @@ class MyFeedView(LoginRequiredMixin, ListView):
         if not getattr(user, 'is_reader', False):
             return Article.objects.none()
 
-        pub_ids = user.subscribed_publishers.values_list('id', flat=True)
-        journ_ids = user.subscribed_journalists.values_list('id', flat=True)
+        # Materialized so the filter uses flat IN (...) lists, not subqueries
+        pub_ids = list(user.subscribed_publishers.values_list('id', flat=True))
+        journ_ids = list(user.subscribed_journalists.values_list('id', flat=True))
 
-        return Article.objects.filter(
-            Q(publisher_id__in=pub_ids) |
-            Q(author_id__in=journ_ids, publisher__isnull=True),
-            status='published'
-        ).select_related('author', 'publisher').order_by('-published_at')
+        return published_article_cards().filter(subscription_filter(pub_ids, journ_ids))
 
 
 class PublisherListView(ListView):
@@ -362,14 +295,20 @@ class JournalistProfileView(DetailView):
     slug_field = 'username'
     slug_url_kwarg = 'username'
 
-    def get_queryset(self):
-        return CustomUser.objects.filter(groups__name='Journalist')
+    def get_object(self, queryset=None):
+        # Looked up by username alone; the role is checked against the
+        # user's cached group names instead of joining groups in SQL
+        journalist = super().get_object(queryset)
+        if 'Journalist' not in journalist.group_names:
+            raise Http404("No journalist matches the given query.")
+        return journalist
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        # author needs no join: the related manager attaches self.object to each row
         context['latest_articles'] = self.object.articles.filter(
             status='published'
-        ).order_by('-published_at')[:6]
+        ).select_related('publisher').defer('content').order_by('-published_at')[:6]
         return context
 
 
@@ -403,17 +342,46 @@ class CustomLoginView(LoginView):
     template_name = 'core/login.html'
     redirect_authenticated_user = True
 
+    # Checked in order; the first role group the user belongs to wins
+    ROLE_REDIRECTS = (
+        ('Journalist', 'core:journalist_dashboard'),
+        ('Editor', 'core:publisher_dashboard'),
+        ('Reader', 'core:my-feed'),
+    )
+
     def get_success_url(self):
-        user = self.request.user
-        if user.is_journalist:
-            return reverse_lazy('core:journalist_dashboard')
-        elif user.is_editor:
-            return reverse_lazy('core:publisher_dashboard')
-        elif user.is_reader:
-            return reverse_lazy('core:my-feed')
+        group_names = self.request.user.group_names
+        for group_name, url_name in self.ROLE_REDIRECTS:
+            if group_name in group_names:
+                return reverse_lazy(url_name)
         return reverse_lazy('core:home')
 
 
+def _status_counts(articles, *statuses):
+    """
+    Count articles per status in a single query.
+
+    Returns a dict mapping each requested status to its count, computed as
+    conditional aggregates instead of one COUNT(*) query per status.
+    """
+    return articles.aggregate(**{
+        status: Count('pk', filter=Q(status=status)) for status in statuses
+    })
+
+
+def _related_count(rows, user_field):
+    """
+    Correlated ``COUNT(*)`` of ``rows`` pointing at the outer user through
+    ``user_field``, for annotating a CustomUser queryset.
+
+    Each relation is counted in its own subquery, so counting several
+    relations never multiplies rows the way joined Count() aggregates do.
+    """
+    counted = rows.filter(**{user_field: OuterRef('pk')}).order_by() \
+        .values(user_field).annotate(count=Count('*')).values('count')
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
+
+
 class ReaderDashboardView(LoginRequiredMixin, TemplateView):
     """Dashboard for readers showing subscriptions, followed journalists, and recent feed."""
     template_name = 'core/reader_dashboard.html'
@@ -421,13 +389,15 @@ class ReaderDashboardView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
-        context['subscribed_publishers'] = user.subscribed_publishers.all()
-        context['followed_journalists'] = user.subscribed_journalists.all()
-        context['recent_feed_articles'] = Article.objects.filter(
-            Q(publisher__in=user.subscribed_publishers.all()) |
-            Q(author__in=user.subscribed_journalists.all(), publisher__isnull=True),
-            status='published'
-        ).select_related('author', 'publisher').order_by('-published_at')[:6]
+        # Subscription IDs are fetched once: they give the counts and the feed
+        # filter without loading every subscribed Publisher / user row
+        pub_ids = list(user.subscribed_publishers.values_list('id', flat=True))
+        journ_ids = list(user.subscribed_journalists.values_list('id', flat=True))
+        context['subscribed_publisher_count'] = len(pub_ids)
+        context['followed_journalist_count'] = len(journ_ids)
+        context['recent_feed_articles'] = Article.objects.published_feed().filter(
+            subscription_filter(pub_ids, journ_ids)
+        ).order_by('-published_at')[:6]
         return context
 
 
@@ -438,10 +408,12 @@ class JournalistDashboardView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
-        context['published_count'] = user.articles.filter(status='published').count()
-        context['pending_count'] = user.articles.filter(status='pending').count()
-        context['draft_count'] = user.articles.filter(status='draft').count()
-        context['recent_articles'] = user.articles.order_by('-published_at', '-created_at')[:6]
+        counts = _status_counts(user.articles.all(), 'published', 'pending', 'draft')
+        context['published_count'] = counts['published']
+        context['pending_count'] = counts['pending']
+        context['draft_count'] = counts['draft']
+        context['recent_articles'] = user.articles.defer('content') \
+            .order_by('-published_at', '-created_at')[:6]
         return context
 
 
@@ -451,8 +423,16 @@ class PublisherDashboardView(LoginRequiredMixin, DetailView):
     template_name = 'core/publisher_dashboard.html'
     context_object_name = 'publisher'
 
+    # Columns rendered for the dashboard's article lists
+    # (publisher_id too: the related manager sets it on every row it returns)
+    ARTICLE_FIELDS = ('id', 'title', 'excerpt', 'status', 'published_at', 'created_at',
+                      'publisher', 'author', 'author__username')
+
     def get_queryset(self):
-        qs = super().get_queryset()
+        # Subscriber count is fetched together with the publisher row
+        qs = super().get_queryset().annotate(
+            subscriber_count=Count('subscribed_readers', distinct=True)
+        )
         if self.request.user.has_perm('core.change_article'):
             return qs
         return qs.filter(editors=self.request.user)
@@ -460,10 +440,12 @@ class PublisherDashboardView(LoginRequiredMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         publisher = self.object
-        context['published_count'] = publisher.articles.filter(status='published').count()
-        context['pending_count'] = publisher.articles.filter(status='pending').count()
-        context['pending_articles'] = publisher.articles.filter(status='pending').order_by('-created_at')[:6]
-        context['recent_articles'] = publisher.articles.filter(status='published').order_by('-published_at')[:6]
+        counts = _status_counts(publisher.articles.all(), 'published', 'pending')
+        context['published_count'] = counts['published']
+        context['pending_count'] = counts['pending']
+        articles = publisher.articles.select_related('author').only(*self.ARTICLE_FIELDS)
+        context['pending_articles'] = articles.filter(status='pending').order_by('-created_at')[:6]
+        context['recent_articles'] = articles.filter(status='published').order_by('-published_at')[:6]
         return context
 
 
@@ -478,6 +460,21 @@ class ProfileView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
+
+        # Only the counts relevant to the user's role, as indexed COUNT(*)
+        # subqueries of a single query
+        role_counts = {}
+        if user.is_journalist:
+            role_counts['article_count'] = _related_count(Article.objects.all(), 'author')
+        if user.is_reader:
+            role_counts['followed_count'] = _related_count(
+                CustomUser.subscribed_journalists.through.objects.all(), 'from_customuser')
+            role_counts['subscribed_count'] = _related_count(
+                Publisher.subscribed_readers.through.objects.all(), 'customuser')
+        counts = {}
+        if role_counts:
+            counts = CustomUser.objects.filter(pk=user.pk).values(**role_counts).get()
+
         context.update({
             'user': user,
             'full_name': user.get_full_name() or user.username,
@@ -486,9 +483,9 @@ class ProfileView(LoginRequiredMixin, TemplateView):
             'profile_picture': user.profile_picture,
             'date_joined': user.date_joined,
             'email': user.email or "Not set",
-            'article_count': user.articles.count() if user.is_journalist else 0,
-            'followed_count': user.subscribed_journalists.count() if user.is_reader else 0,
-            'subscribed_count': user.subscribed_publishers.count() if user.is_reader else 0,
+            'article_count': counts.get('article_count', 0),
+            'followed_count': counts.get('followed_count', 0),
+            'subscribed_count': counts.get('subscribed_count', 0),
         })
         return context
 
@@ -504,10 +501,19 @@ class MySubscriptionsView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
+        # Evaluated once here; has_subscriptions reuses the lists instead of two exists()
+        # Only the columns the template renders
+        subscribed_publishers = list(
+            user.subscribed_publishers.only('id', 'name', 'description').order_by('name')
+        )
+        followed_journalists = list(
+            user.subscribed_journalists.only('id', 'username', 'first_name', 'last_name', 'bio')
+            .order_by('username')
+        )
         context.update({
-            'subscribed_publishers': user.subscribed_publishers.all().order_by('name'),
-            'followed_journalists': user.subscribed_journalists.all().order_by('username'),
-            'has_subscriptions': user.subscribed_publishers.exists() or user.subscribed_journalists.exists(),
+            'subscribed_publishers': subscribed_publishers,
+            'followed_journalists': followed_journalists,
+            'has_subscriptions': bool(subscribed_publishers or followed_journalists),
         })
         return context
 
@@ -520,11 +526,15 @@ class SubscribePublisherView(LoginRequiredMixin, View):
         publisher = get_object_or_404(Publisher, pk=pk)
         user = request.user
 
-        if not user.groups.filter(name='Reader').exists():
+        if not user.is_reader:
             messages.error(request, "Only readers can subscribe.")
             return redirect('core:publisher_articles', pk=publisher.pk)
 
-        if user.subscribed_publishers.filter(pk=publisher.pk).exists():
+        # Probe the M2M through table directly (unique index, no join to Publisher)
+        subscribed = CustomUser.subscribed_publishers.through.objects.filter(
+            customuser_id=user.pk, publisher_id=publisher.pk
+        ).exists()
+        if subscribed:
             user.subscribed_publishers.remove(publisher)
             messages.success(request, f"Unsubscribed from {publisher.name}.")
         else:
@@ -535,19 +545,61 @@ class SubscribePublisherView(LoginRequiredMixin, View):
 
 
 class ArticleListView(ListView):
-    """Public list of all published articles with pagination."""
+    """
+    Public list of all published articles, newest first, with keyset pagination.
+
+    Pages are addressed by the last article seen (``?after=<published_at>&
+    after_id=<pk>``) instead of a page number, so every page is an index range
+    scan of the same cost, with no OFFSET. The first page is cached.
+    """
     model = Article
     template_name = 'core/article_list.html'
     context_object_name = 'articles'
-    paginate_by = 12
+    page_size = 12
+
+    def get_cursor(self):
+        """Return the ``(published_at, pk)`` cursor from the query string, or None."""
+        after = self.request.GET.get('after')
+        after_id = self.request.GET.get('after_id')
+        if not after or not after_id:
+            return None
+        try:
+            published_at = parse_datetime(after)
+            pk = int(after_id)
+        except ValueError:
+            published_at = None
+        if published_at is None:
+            raise Http404("Invalid page cursor.")
+        return published_at, pk
 
     def get_queryset(self):
-        return Article.objects.filter(status='published') \
-            .select_related('author', 'publisher') \
-            .order_by('-published_at')
+        # One extra row tells whether an older page exists
+        articles = published_article_cards().order_by('-published_at', '-id')
+        limit = self.page_size + 1
+        # Parsed once here; get_context_data() reads it back from self.cursor
+        self.cursor = self.get_cursor()
+        if self.cursor is None:
+            return cached_article_data(f'article-list-first:{limit}', lambda: list(articles[:limit]))
+        published_at, pk = self.cursor
+        return list(articles.filter(
+            Q(published_at__lt=published_at) | Q(published_at=published_at, id__lt=pk)
+        )[:limit])
 
     def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
+        rows = self.object_list
+        articles = rows[:self.page_size]
+        context = super().get_context_data(object_list=articles, **kwargs)
+
+        last = articles[-1] if articles else None
+        next_page_url = None
+        # Articles without published_at sort outside the keyset and end the list
+        if len(rows) > self.page_size and last.published_at is not None:
+            next_page_url = '?' + urlencode({'after': last.published_at.isoformat(), 'after_id': last.pk})
+
+        is_first_page = self.cursor is None
+        context['next_page_url'] = next_page_url
+        context['is_first_page'] = is_first_page
+        context['is_paginated'] = next_page_url is not None or not is_first_page
         context['page_title'] = "All Articles"
         context['show_search'] = True
         return context
@@ -557,14 +609,18 @@ class ArticleListView(ListView):
 # Follow / Unfollow
 # ──────────────────────────────────────────────────────────────
 
+def _get_journalist_or_404(username):
+    """Fetch a user by username and 404 unless they are in the Journalist group."""
+    journalist = get_object_or_404(CustomUser, username=username)
+    if 'Journalist' not in journalist.group_names:
+        raise Http404("No journalist matches the given query.")
+    return journalist
+
+
 @login_required
 def follow_journalist(request, username):
     """Follow a journalist (reader action)."""
-    journalist = get_object_or_404(
-        CustomUser,
-        username=username,
-        groups__name='Journalist'
-    )
+    journalist = _get_journalist_or_404(username)
 
     if request.user == journalist:
         messages.error(request, "You cannot follow yourself.")
@@ -578,11 +634,7 @@ def follow_journalist(request, username):
 @login_required
 def unfollow_journalist(request, username):
     """Unfollow a journalist (reader action)."""
-    journalist = get_object_or_404(
-        CustomUser,
-        username=username,
-        groups__name='Journalist'
-    )
+    journalist = _get_journalist_or_404(username)
 
     request.user.subscribed_journalists.remove(journalist)
     messages.success(request, f"Unfollowed {journalist.get_full_name() or journalist.username}.")
@@ -599,12 +651,18 @@ def unfollow_journalist(request, username):
 def article_delete(request, pk):
     """Delete an article (with permission checks)."""
     article = get_object_or_404(Article, pk=pk)
+    user = request.user
 
+    # Cheapest checks first (role names are memoized on the user); FK ids are
+    # compared without loading author/publisher, and publisher editorship is
+    # an indexed EXISTS on the through table instead of loading every editor
     can_delete = (
-        request.user.has_perm('core.delete_article')
-        or request.user.is_editor
-        or (article.author == request.user and request.user.is_journalist)
-        or (article.publisher and request.user in article.publisher.editors.all())
+        user.has_perm('core.delete_article')
+        or user.is_editor
+        or (article.author_id == user.pk and user.is_journalist)
+        or (article.publisher_id and Publisher.editors.through.objects.filter(
+            publisher_id=article.publisher_id, customuser_id=user.pk
+        ).exists())
     )
 
     if not can_delete:
@@ -615,18 +673,23 @@ def article_delete(request, pk):
     article.delete()
     messages.success(request, f"Article '{title}' has been deleted.")
 
-    if article.publisher:
-        return redirect('core:publisher_articles', pk=article.publisher.pk)
+    if article.publisher_id:
+        return redirect('core:publisher_articles', pk=article.publisher_id)
     return redirect('core:home')
 
 
 def publisher_articles(request, pk):
     """Public view of all published articles from a specific publisher."""
     publisher = get_object_or_404(Publisher, pk=pk)
-    articles = Article.objects.filter(
-        publisher=publisher,
-        status='published'
-    ).select_related('author').order_by('-published_at')
+    # Through the related manager every row gets `publisher` attached in Python;
+    # author and lead image are joined, and only the rendered columns are read
+    articles = publisher.articles.filter(status='published') \
+        .select_related('author', 'lead_image') \
+        .only(
+            'id', 'title', 'excerpt', 'published_at', 'publisher',
+            'author', 'author__username', 'author__first_name', 'author__last_name',
+            'lead_image', 'lead_image__image',
+        ).order_by('-published_at')
     return render(request, 'core/publisher_articles.html', {
         'publisher': publisher,
         'articles': articles,
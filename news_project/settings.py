@@ -80,6 +80,14 @@ REST_FRAMEWORK = {
 
 SITE_ID = 1
 
+# Local-memory cache by default; swap for django.core.cache.backends.redis.RedisCache
+# in production so cached entries are shared between worker processes
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 WSGI_APPLICATION = 'news_project.wsgi.application'
 
 DATABASES = {
@@ -131,6 +139,9 @@ LOGIN_URL = '/accounts/login/'
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
+# Absolute base URL for links in notification emails and social posts
+SITE_URL = 'http://localhost:8000'
+
 
 # X/Twitter credentials (OAuth1 intended; Bearer-only posting removed for correctness)
 X_CONSUMER_KEY = ''